@@ -1,5 +1,5 @@
 import asyncio
-from typing import List, Optional
+from typing import Any, ClassVar, List, Optional
 
 import flet as ft
 
@@ -12,12 +12,27 @@ from .types import (
 
 __all__ = ["WebView"]
 
+_SUPPORTED_PLATFORMS: frozenset[ft.PagePlatform] = frozenset(
+    {ft.PagePlatform.ANDROID, ft.PagePlatform.IOS, ft.PagePlatform.MACOS}
+)
+
+# A queued method call: method name, arguments and the caller's future, which is
+# `None` for calls made by sync methods.
+_QueuedCall = tuple[str, Optional[dict[str, Any]], Optional["asyncio.Future[Any]"]]
+
 
 @ft.control("WebView")
 class WebView(ft.ConstrainedControl):
     """
     Easily load webpages while allowing user interaction.
 
+    Method calls are sent to the client in the order they are made. Calls made
+    while a previous call is in flight, or concurrently, e.g. with
+    `asyncio.gather()`, are sent together in a single message.
+
+    By default calls wait for the client without a timeout. See `method_timeout`
+    to limit how long a call may take.
+
     Note:
         Works only on the following platforms: iOS, Android, macOS and Web.
     """
@@ -38,6 +53,14 @@ class WebView(ft.ConstrainedControl):
     bgcolor: Optional[ft.ColorValue] = None
     """Defines the background color of the WebView."""
 
+    scroll_interval: int = 0
+    """
+    Throttling in milliseconds for `on_scroll` event.
+
+    While the page is scrolled, at most one event is sent per interval, carrying
+    the latest scroll position. `0` sends every scroll position change.
+    """
+
     on_page_started: ft.OptionalControlEventHandler["WebView"] = None
     """
     Fires soon as the first loading process of the webview page is started.
@@ -91,8 +114,10 @@ class WebView(ft.ConstrainedControl):
     on_scroll: ft.OptionalEventHandler[WebViewScrollEvent["WebView"]] = None
     """
     Fires when the web page's scroll position changes.
+
+    See also `scroll_interval` to throttle this event.
     
-    Event handler argument is of type `WebviewScrollEvent`.
+    Event handler argument is of type `WebViewScrollEvent`.
     
     Note:
         Works only on the following platforms: iOS, Android and macOS.
@@ -104,7 +129,7 @@ class WebView(ft.ConstrainedControl):
     """
     Fires when a log message is written to the JavaScript console.
     
-    Event handler argument is of type `WebviewConsoleMessageEvent`.
+    Event handler argument is of type `WebViewConsoleMessageEvent`.
     
     Note:
         Works only on the following platforms: iOS, Android and macOS.
@@ -116,23 +141,218 @@ class WebView(ft.ConstrainedControl):
     """
     Fires when the web page attempts to display a JavaScript alert() dialog.
     
-    Event handler argument is of type `WebviewJavaScriptEvent`.
+    Event handler argument is of type `WebViewJavaScriptEvent`.
     
     Note:
         Works only on the following platforms: iOS, Android and macOS.
     """
 
+    method_timeout: ClassVar[Optional[float]] = None
+    """
+    Maximum time in seconds to wait for the client to complete a method call, or
+    `None` to wait indefinitely.
+
+    Calls sent together in one message get this timeout once per call. A call that
+    times out raises `TimeoutError`, but the client may still be running it while
+    later calls are sent, so they are no longer guaranteed to run in order.
+
+    Can be overridden on a subclass or on an instance.
+    """
+
+    _dispatch_queue = None
+    _dispatcher = None
+    _platform_ok = None
+
+    def did_mount(self):
+        super().did_mount()
+        self._platform_ok = None
+
+    def will_unmount(self):
+        super().will_unmount()
+        self._platform_ok = None
+        self._stop_dispatcher()
+
     def _check_mobile_or_mac_platform(self):
-        """Checks/Validates support for the current platform (iOS, Android, or macOS)."""
-        assert self.page is not None, "WebView must be added to page first."
-        if self.page.web or self.page.platform not in [
-            ft.PagePlatform.ANDROID,
-            ft.PagePlatform.IOS,
-            ft.PagePlatform.MACOS,
-        ]:
+        """
+        Checks/Validates support for the current platform (iOS, Android, or macOS).
+
+        A successful check is remembered until the control is mounted or unmounted.
+        """
+        if self._platform_ok:
+            return
+        if self.page is None:
+            raise RuntimeError("WebView must be added to page first.")
+        if self.page.web or self.page.platform not in _SUPPORTED_PLATFORMS:
             raise ft.FletUnsupportedPlatformException(
                 "This method is supported on Android, iOS and macOS platforms only."
             )
+        self._platform_ok = True
+
+    def _post(self, method_name: str, arguments: Optional[dict[str, Any]] = None):
+        """
+        Queues a method call whose result is not awaited.
+
+        Used by sync methods. A failure of the call is reported to the event loop's
+        exception handler.
+        """
+        self._check_mobile_or_mac_platform()
+        if self._dispatcher is None:
+            self._start_dispatcher()
+        self._dispatch_queue.put_nowait((method_name, arguments, None))
+
+    def _enqueue(
+        self, method_name: str, arguments: Optional[dict[str, Any]] = None
+    ) -> "asyncio.Future[Any]":
+        """
+        Queues a method call to be sent to the client together with all other calls
+        queued while the previous batch was in flight.
+
+        Used by async methods; together with `_post()` this is the only path by
+        which calls reach the client, so the platform check is done once per call.
+
+        Returns:
+            A future resolved with the result of the call.
+        """
+        self._check_mobile_or_mac_platform()
+        if self._dispatcher is None:
+            self._start_dispatcher()
+        future = asyncio.get_running_loop().create_future()
+        self._dispatch_queue.put_nowait((method_name, arguments, future))
+        return future
+
+    def _start_dispatcher(self):
+        """Creates the dispatch queue and the task consuming it."""
+        self._dispatch_queue = asyncio.Queue()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._dispatcher.add_done_callback(self._on_dispatcher_done)
+
+    def _stop_dispatcher(self):
+        """Cancels the dispatcher task and all calls still waiting in the queue."""
+        if self._dispatcher is None:
+            return
+        self._dispatcher.cancel()
+        self._reset_dispatcher(asyncio.CancelledError())
+
+    def _on_dispatcher_done(self, task: "asyncio.Task[None]"):
+        """
+        Resets the dispatcher if its task ended on its own, so that the next call
+        starts a new one instead of queueing calls nobody reads.
+        """
+        if task is not self._dispatcher:
+            return
+        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+        if not isinstance(error, asyncio.CancelledError):
+            task.get_loop().call_exception_handler(
+                {"message": "WebView dispatcher failed", "exception": error}
+            )
+        self._reset_dispatcher(error)
+
+    def _reset_dispatcher(self, error: BaseException):
+        """Fails all calls still waiting in the queue and forgets the dispatcher."""
+        queue = self._dispatch_queue
+        self._dispatcher = None
+        self._dispatch_queue = None
+        ops = []
+        while not queue.empty():
+            ops.append(queue.get_nowait())
+        self._fail_calls(ops, error)
+
+    async def _dispatch(self):
+        """Sends queued method calls to the client, one batch at a time."""
+        queue = self._dispatch_queue
+        while True:
+            ops = [await queue.get()]
+            while not queue.empty():
+                ops.append(queue.get_nowait())
+            try:
+                await self._send_batch(ops)
+            except BaseException as e:
+                self._fail_calls(ops, e)
+                raise
+
+    async def _send_batch(self, ops: list[_QueuedCall]):
+        """
+        Invokes the queued method calls and resolves their futures in order.
+
+        Of several `scroll_to` calls queued one after another only the last one is
+        sent, as the earlier ones would have no visible effect; they are resolved
+        or failed together with it.
+
+        A single call is invoked directly, several calls are sent as one `batch`
+        message of `(method_name, arguments)` pairs. The client runs every call of a
+        batch and returns a `{"result": ...}` or `{"error": ...}` entry for each, so
+        a failing call only fails its own future. Only a failure of the `batch`
+        message itself fails all of them.
+        """
+        groups: list[list[_QueuedCall]] = []
+        for op in ops:
+            if groups and op[0] == "scroll_to" and groups[-1][-1][0] == "scroll_to":
+                groups[-1].append(op)
+            else:
+                groups.append([op])
+
+        try:
+            if len(groups) == 1:
+                method_name, arguments, _ = groups[0][-1]
+                result = await self._invoke_method_async(
+                    method_name, arguments=arguments, timeout=self.method_timeout
+                )
+                entries = [{"result": result}]
+            else:
+                entries = await self._invoke_method_async(
+                    "batch",
+                    arguments={
+                        "ops": [(group[-1][0], group[-1][1]) for group in groups]
+                    },
+                    timeout=(
+                        None
+                        if self.method_timeout is None
+                        else self.method_timeout * len(groups)
+                    ),
+                )
+        except Exception as e:
+            self._fail_calls(ops, e)
+            return
+        if len(entries) != len(groups):
+            self._fail_calls(
+                ops,
+                RuntimeError(
+                    f"WebView batch of {len(groups)} calls returned "
+                    f"{len(entries)} results."
+                ),
+            )
+            return
+        for group, entry in zip(groups, entries):
+            if "error" in entry:
+                self._fail_calls(group, RuntimeError(entry["error"]))
+                continue
+            for _, _, future in group:
+                if future is not None and not future.done():
+                    future.set_result(entry.get("result"))
+
+    def _fail_calls(self, ops: list[_QueuedCall], error: BaseException):
+        """
+        Fails the futures of the given calls with `error`.
+
+        Calls queued by `_post()` have no future; their error is reported to the
+        event loop's exception handler instead. A `CancelledError` cancels the
+        futures and is not reported.
+        """
+        cancelled = isinstance(error, asyncio.CancelledError)
+        for method_name, _, future in ops:
+            if future is None:
+                if not cancelled:
+                    asyncio.get_running_loop().call_exception_handler(
+                        {
+                            "message": f"WebView.{method_name}() failed",
+                            "exception": error,
+                        }
+                    )
+            elif not future.done():
+                if cancelled:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
 
     def reload(self):
         """
@@ -141,8 +361,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.reload_async())
+        self._post("reload")
 
     async def reload_async(self):
         """
@@ -151,8 +370,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("reload")
+        await self._enqueue("reload")
 
     async def can_go_back_async(self) -> bool:
         """
@@ -164,8 +382,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        return await self._invoke_method_async("can_go_back")
+        return await self._enqueue("can_go_back")
 
     async def can_go_forward(self) -> bool:
         """
@@ -177,8 +394,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        return await self._invoke_method_async("can_go_forward")
+        return await self._enqueue("can_go_forward")
 
     def go_back(self):
         """
@@ -187,8 +403,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.go_back_async())
+        self._post("go_back")
 
     async def go_back_async(self):
         """
@@ -197,8 +412,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("go_back")
+        await self._enqueue("go_back")
 
     def go_forward(self):
         """
@@ -207,8 +421,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.go_forward_async())
+        self._post("go_forward")
 
     async def go_forward_async(self):
         """
@@ -217,8 +430,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("go_forward")
+        await self._enqueue("go_forward")
 
     def enable_zoom(self):
         """
@@ -227,8 +439,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.enable_zoom_async())
+        self._post("enable_zoom")
 
     async def enable_zoom_async(self):
         """
@@ -237,8 +448,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("enable_zoom")
+        await self._enqueue("enable_zoom")
 
     def disable_zoom(self):
         """
@@ -247,8 +457,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.disable_zoom_async())
+        self._post("disable_zoom")
 
     async def disable_zoom_async(self):
         """
@@ -257,8 +466,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("disable_zoom")
+        await self._enqueue("disable_zoom")
 
     def clear_cache(self):
         """
@@ -272,8 +480,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.clear_cache_async())
+        self._post("clear_cache")
 
     async def clear_cache_async(self):
         """
@@ -287,8 +494,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("clear_cache")
+        await self._enqueue("clear_cache")
 
     def clear_local_storage(self):
         """
@@ -297,8 +503,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.clear_local_storage_async())
+        self._post("clear_local_storage")
 
     async def clear_local_storage_async(self):
         """
@@ -307,8 +512,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("clear_local_storage")
+        await self._enqueue("clear_local_storage")
 
     async def get_current_url_async(self) -> Optional[str]:
         """
@@ -320,8 +524,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        return await self._invoke_method_async("get_current_url")
+        return await self._enqueue("get_current_url")
 
     async def get_title_async(self) -> Optional[str]:
         """
@@ -333,8 +536,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        return await self._invoke_method_async("get_title")
+        return await self._enqueue("get_title")
 
     async def get_user_agent_async(self) -> Optional[str]:
         """
@@ -346,8 +548,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        return await self._invoke_method_async("get_user_agent")
+        return await self._enqueue("get_user_agent")
 
     def load_file(self, path: str):
         """
@@ -359,8 +560,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.load_file_async(path))
+        self._post("load_file", {"path": path})
 
     async def load_file_async(self, path: str):
         """
@@ -372,8 +572,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("load_file", arguments={"path": path})
+        await self._enqueue("load_file", {"path": path})
 
     def load_request(self, url: str, method: RequestMethod = RequestMethod.GET):
         """
@@ -383,8 +582,7 @@ class WebView(ft.ConstrainedControl):
             url: The URL to load.
             method: The HTTP method to use.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.load_request_async(url, method))
+        self._post("load_request", {"url": url, "method": RequestMethod(method).value})
 
     async def load_request_async(
         self, url: str, method: RequestMethod = RequestMethod.GET
@@ -399,9 +597,8 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async(
-            "load_request", arguments={"url": url, "method": method}
+        await self._enqueue(
+            "load_request", {"url": url, "method": RequestMethod(method).value}
         )
 
     def run_javascript(self, value: str):
@@ -414,8 +611,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.run_javascript_async(value))
+        self._post("run_javascript", {"value": value})
 
     async def run_javascript_async(self, value: str):
         """
@@ -427,8 +623,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("run_javascript", arguments={"value": value})
+        await self._enqueue("run_javascript", {"value": value})
 
     def load_html(self, value: str, base_url: Optional[str] = None):
         """
@@ -441,8 +636,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.load_html_async(value, base_url))
+        self._post("load_html", {"value": value, "base_url": base_url})
 
     async def load_html_async(self, value: str, base_url: Optional[str] = None):
         """
@@ -455,15 +649,15 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async(
-            "load_html", arguments={"value": value, "base_url": base_url}
-        )
+        await self._enqueue("load_html", {"value": value, "base_url": base_url})
 
     def scroll_to(self, x: int, y: int):
         """
         Scroll to the provided position of webview pixels.
 
+        If several `scroll_to` calls are queued back to back, only the last one is
+        sent to the client and the earlier ones complete with its outcome.
+
         Args:
             x: The x-coordinate of the scroll position.
             y: The y-coordinate of the scroll position.
@@ -471,13 +665,15 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.scroll_to_async(x, y))
+        self._post("scroll_to", {"x": x, "y": y})
 
     async def scroll_to_async(self, x: int, y: int):
         """
         Scroll to the provided position of webview pixels.
 
+        If several `scroll_to` calls are queued back to back, only the last one is
+        sent to the client and the earlier ones complete with its outcome.
+
         Args:
             x: The x-coordinate of the scroll position.
             y: The y-coordinate of the scroll position.
@@ -485,8 +681,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("scroll_to", arguments={"x": x, "y": y})
+        await self._enqueue("scroll_to", {"x": x, "y": y})
 
     def scroll_by(self, x: int, y: int):
         """
@@ -499,8 +694,7 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        asyncio.create_task(self.scroll_by_async(x, y))
+        self._post("scroll_by", {"x": x, "y": y})
 
     async def scroll_by_async(self, x: int, y: int):
         """
@@ -513,5 +707,4 @@ class WebView(ft.ConstrainedControl):
         Note:
             Works only on the following platforms: iOS, Android and macOS.
         """
-        self._check_mobile_or_mac_platform()
-        await self._invoke_method_async("scroll_by", arguments={"x": x, "y": y})
+        await self._enqueue("scroll_by", {"x": x, "y": y})
@@ -1,3 +1,5 @@
+import 'dart:async';
+
 import 'package:flet/flet.dart';
 import 'package:flet_webview/src/utils/webview.dart';
 import 'package:flutter/material.dart';
@@ -14,6 +16,10 @@ class WebviewMobileAndMac extends StatefulWidget {
 
 class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
   late WebViewController controller;
+  bool? _enableJavascript;
+  ScrollPositionChange? _pendingScroll;
+  DateTime? _lastScrollEventTime;
+  Timer? _scrollTimer;
 
   @override
   void initState() {
@@ -23,7 +29,7 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
     var params = const PlatformWebViewControllerCreationParams();
     controller = WebViewController.fromPlatformCreationParams(params);
 
-    controller.setJavaScriptMode(JavaScriptMode.unrestricted);
+    _updateJavascriptMode();
     controller.setNavigationDelegate(
       NavigationDelegate(
         onProgress: (int progress) {
@@ -42,7 +48,7 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
           widget.control.triggerEvent("web_resource_error", error.description);
         },
         onNavigationRequest: (NavigationRequest request) {
-          var links = widget.control.get("prevent_link");
+          var links = widget.control.get("prevent_links");
           var prevent = links is List &&
               links.isNotEmpty &&
               links.any((l) => request.url.startsWith(l));
@@ -61,10 +67,7 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
 
     // scroll
     if (!isMacOSDesktop()) {
-      controller.setOnScrollPositionChange((ScrollPositionChange position) {
-        widget.control
-            .triggerEvent("scroll", {"x": position.x, "y": position.y});
-      });
+      controller.setOnScrollPositionChange(_onScrollPositionChange);
     }
 
     // console
@@ -81,9 +84,57 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
     });
   }
 
+  void _updateJavascriptMode() {
+    var enableJavascript = widget.control.getBool("enable_javascript", true)!;
+    if (enableJavascript != _enableJavascript) {
+      _enableJavascript = enableJavascript;
+      controller.setJavaScriptMode(enableJavascript
+          ? JavaScriptMode.unrestricted
+          : JavaScriptMode.disabled);
+    }
+  }
+
+  void _onScrollPositionChange(ScrollPositionChange position) {
+    _pendingScroll = position;
+    if (_scrollTimer != null) {
+      return;
+    }
+    var interval = widget.control.getInt("scroll_interval", 0)!;
+    var elapsed = _lastScrollEventTime == null
+        ? interval
+        : DateTime.now().difference(_lastScrollEventTime!).inMilliseconds;
+    if (elapsed >= interval) {
+      _triggerScrollEvent();
+    } else {
+      _scrollTimer = Timer(
+          Duration(milliseconds: interval - elapsed), _triggerScrollEvent);
+    }
+  }
+
+  void _triggerScrollEvent() {
+    _scrollTimer = null;
+    var position = _pendingScroll;
+    if (position == null) {
+      return;
+    }
+    _pendingScroll = null;
+    _lastScrollEventTime = DateTime.now();
+    widget.control.triggerEvent("scroll", {"x": position.x, "y": position.y});
+  }
+
   Future<dynamic> _invokeMethod(String name, dynamic args) async {
     debugPrint("WebView.$name($args)");
     switch (name) {
+      case "batch":
+        var results = [];
+        for (var op in args["ops"]) {
+          try {
+            results.add({"result": await _invokeMethod(op[0], op[1])});
+          } catch (e) {
+            results.add({"error": e.toString()});
+          }
+        }
+        return results;
       case "reload":
         await controller.reload();
         break;
@@ -170,6 +221,7 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
   void dispose() {
     debugPrint("WebViewControl dispose: ${widget.control.id}");
     widget.control.removeInvokeMethodListener(_invokeMethod);
+    _scrollTimer?.cancel();
     super.dispose();
   }
 
@@ -177,6 +229,8 @@ class _WebviewMobileAndMacState extends State<WebviewMobileAndMac> {
   Widget build(BuildContext context) {
     debugPrint("WebViewControl build: ${widget.control.id}");
 
+    _updateJavascriptMode();
+
     var bgcolor = widget.control.getColor("bgcolor", context);
 
     if (bgcolor != null) {